@@ -1,4 +1,50 @@
 #!/usr/bin/env python3
+import glob
+import hashlib
+import importlib.metadata
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+JAR_PATH = os.path.join(HERE, "..", "target", "quicklink-1.0.0-aws.jar")
+# Only set when invoked by the CDK CLI; a bare `python app.py` synths to a temp dir
+OUT_DIR = os.environ.get("CDK_OUTDIR")
+
+
+def compute_synth_hash() -> str:
+    """Hash everything that can change the synthesized assembly."""
+    digest = hashlib.sha256()
+    inputs = glob.glob(os.path.join(HERE, "*.py")) + [
+        os.path.join(HERE, "cdk.json"),
+        os.path.join(HERE, "requirements.txt"),
+    ]
+    for path in sorted(inputs):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    if os.path.exists(JAR_PATH):
+        stat = os.stat(JAR_PATH)
+        digest.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode())
+    digest.update(importlib.metadata.version("aws-cdk-lib").encode())
+    digest.update(os.environ.get("CDK_CONTEXT_JSON", "").encode())
+    return digest.hexdigest()
+
+
+synth_hash = compute_synth_hash() if OUT_DIR else None
+hash_file = os.path.join(OUT_DIR, ".synth-hash") if OUT_DIR else None
+
+# Reuse the previous cloud assembly when nothing it depends on has changed
+if hash_file and os.path.exists(hash_file):
+    if os.path.exists(os.path.join(OUT_DIR, "manifest.json")):
+        with open(hash_file) as f:
+            if f.read().strip() == synth_hash:
+                sys.exit(0)
+    # Drop the stale marker so an interrupted synth can never be reused
+    os.remove(hash_file)
+
+# Keep stack traces out of Annotations (warning/error) metadata; must be set
+# before aws_cdk starts the jsii runtime, which copies the environment
+os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
+
 import aws_cdk as cdk
 from quicklink_stack import QuickLinkStack
 
@@ -12,3 +58,7 @@ stack = QuickLinkStack(app, "QuickLinkStack",
 )
 
 app.synth()
+
+if hash_file:
+    with open(hash_file, "w") as f:
+        f.write(synth_hash)
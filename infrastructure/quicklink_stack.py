@@ -1,21 +1,63 @@
 """QuickLink CDK Stack - Defines AWS infrastructure for URL shortener."""
+import hashlib
+import os
+
 from aws_cdk import (
     Stack,
+    Annotations,
+    AssetHashType,
     RemovalPolicy,
     Duration,
     CfnOutput,
     aws_dynamodb as dynamodb,
     aws_lambda as lambda_,
-    aws_apigateway as apigateway,
+    aws_apigatewayv2 as apigwv2,
+    aws_apigatewayv2_integrations as apigwv2_integrations,
+    aws_certificatemanager as acm,
     aws_sqs as sqs,
 )
 from constructs import Construct
 
+JAR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "target", "quicklink-1.0.0-aws.jar")
+
+
+def jar_asset_hash(jar_path: str) -> str:
+    """Return the JAR's sha256, cached in a sidecar file keyed by mtime and size."""
+    if not os.path.isfile(jar_path):
+        raise FileNotFoundError(
+            f"Lambda JAR not found at {os.path.normpath(jar_path)} - run 'mvn package' first"
+        )
+
+    stat = os.stat(jar_path)
+    stamp = f"{stat.st_mtime_ns}:{stat.st_size}"
+    sidecar = f"{jar_path}.sha256"
+
+    if os.path.exists(sidecar):
+        with open(sidecar) as f:
+            cached_stamp, _, cached_hash = f.read().strip().partition(" ")
+        if cached_stamp == stamp:
+            return cached_hash
+
+    digest = hashlib.sha256()
+    with open(jar_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    asset_hash = digest.hexdigest()
+
+    with open(sidecar, "w") as f:
+        f.write(f"{stamp} {asset_hash}")
+    return asset_hash
+
+
 class QuickLinkStack(Stack):
 
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        # Lambda does not allow SnapStart and provisioned concurrency together,
+        # so opting into warm instances (-c provisionedConcurrency=N) replaces SnapStart
+        provisioned_concurrency = int(self.node.try_get_context("provisionedConcurrency") or 0)
+
         # DynamoDB Table: quicklink-urls
         self.urls_table = dynamodb.Table(
             self, "UrlsTable",
@@ -46,7 +88,8 @@ class QuickLinkStack(Stack):
             self, "AnalyticsQueue",
             queue_name="quicklink-analytics",
             retention_period=Duration.days(4),
-            visibility_timeout=Duration.seconds(30)
+            visibility_timeout=Duration.seconds(30),
+            receive_message_wait_time=Duration.seconds(20)  # Long polling for consumers
         )
 
         # Lambda Function: QuickLink Spring Boot Application
@@ -54,18 +97,32 @@ class QuickLinkStack(Stack):
             self, "QuickLinkFunction",
             function_name="quicklink-service",
             runtime=lambda_.Runtime.JAVA_17,
+            architecture=lambda_.Architecture.ARM_64,
             handler="inc.skt.quicklink.StreamLambdaHandler::handleRequest",
-            code=lambda_.Code.from_asset("../target/quicklink-1.0.0-aws.jar"),
-            memory_size=512,
+            code=lambda_.Code.from_asset(
+                JAR_PATH,
+                asset_hash=jar_asset_hash(JAR_PATH),
+                asset_hash_type=AssetHashType.CUSTOM
+            ),
+            memory_size=1769,  # 1769 MB = one full vCPU for Spring context init
             timeout=Duration.seconds(10),
+            snap_start=None if provisioned_concurrency else lambda_.SnapStartConf.ON_PUBLISHED_VERSIONS,
             environment={
                 "SPRING_PROFILES_ACTIVE": "prod",
                 "DYNAMODB_TABLE_URLS": self.urls_table.table_name,
                 "DYNAMODB_TABLE_TOKENS": self.tokens_table.table_name,
-                "AWS_SQS_ANALYTICS_QUEUE_URL": self.analytics_queue.queue_url
+                "AWS_SQS_ANALYTICS_QUEUE_URL": self.analytics_queue.queue_url,
+                # C1-only JIT: skip C2 compilation on the cold-start path
+                "JAVA_TOOL_OPTIONS": "-XX:+TieredCompilation -XX:TieredStopAtLevel=1"
             }
         )
 
+        # SnapStart warns unless a version is published; the live alias below publishes one
+        Annotations.of(self.quicklink_function).acknowledge_warning(
+            "@aws-cdk/aws-lambda:snapStartRequirePublish",
+            "Invoked via the live alias on current_version"
+        )
+
         # Grant Lambda permissions to access DynamoDB tables
         self.urls_table.grant_read_write_data(self.quicklink_function)
         self.tokens_table.grant_read_write_data(self.quicklink_function)
@@ -73,30 +130,76 @@ class QuickLinkStack(Stack):
         # Grant Lambda permission to send messages to SQS
         self.analytics_queue.grant_send_messages(self.quicklink_function)
 
-        # API Gateway: REST API
-        self.api = apigateway.LambdaRestApi(
+        # Lambda Alias: SnapStart and provisioned concurrency only apply to published versions
+        self.quicklink_alias = lambda_.Alias(
+            self, "QuickLinkAlias",
+            alias_name="live",
+            version=self.quicklink_function.current_version,
+            provisioned_concurrent_executions=provisioned_concurrency or None
+        )
+
+        # API Gateway: HTTP API (proxies every route to Spring Boot)
+        self.api = apigwv2.HttpApi(
             self, "QuickLinkApi",
-            rest_api_name="quicklink-api",
-            handler=self.quicklink_function,
-            proxy=True,
-            binary_media_types=["*/*"],
-            deploy_options=apigateway.StageOptions(
-                stage_name="prod",
-                throttling_rate_limit=50,
-                throttling_burst_limit=100
+            api_name="quicklink-api",
+            default_integration=apigwv2_integrations.HttpLambdaIntegration(
+                "QuickLinkIntegration",
+                handler=self.quicklink_alias
+            ),
+            create_default_stage=False
+        )
+
+        # $default stage keeps request paths free of a stage prefix
+        self.api_stage = apigwv2.HttpStage(
+            self, "QuickLinkApiStage",
+            http_api=self.api,
+            stage_name="$default",
+            auto_deploy=True,
+            throttle=apigwv2.ThrottleSettings(
+                rate_limit=50,
+                burst_limit=100
             )
         )
 
+        # Custom domain (-c domainName=... -c certificateArn=...): keeps short links
+        # stable even if the underlying API is ever replaced again
+        domain_name = self.node.try_get_context("domainName")
+        if domain_name:
+            certificate_arn = self.node.try_get_context("certificateArn")
+            if not certificate_arn:
+                raise ValueError("certificateArn context is required when domainName is set")
+
+            self.api_domain = apigwv2.DomainName(
+                self, "QuickLinkDomain",
+                domain_name=domain_name,
+                certificate=acm.Certificate.from_certificate_arn(
+                    self, "QuickLinkCertificate", certificate_arn
+                )
+            )
+
+            apigwv2.ApiMapping(
+                self, "QuickLinkApiMapping",
+                api=self.api,
+                domain_name=self.api_domain,
+                stage=self.api_stage
+            )
+
+            CfnOutput(
+                self, "CustomDomainTarget",
+                value=self.api_domain.regional_domain_name,
+                description=f"DNS target (CNAME/alias) for {domain_name}"
+            )
+
         # CloudFormation Outputs
         CfnOutput(
             self, "ApiUrl",
-            value=self.api.url,
+            value=self.api_stage.url,
             description="API Gateway endpoint URL"
         )
         
         CfnOutput(
             self, "HealthEndpoint",
-            value=f"{self.api.url}api/v1/health",
+            value=f"{self.api_stage.url}api/v1/health",
             description="Health check endpoint URL"
         )
         
@@ -106,6 +209,12 @@ class QuickLinkStack(Stack):
             description="Lambda function name"
         )
         
+        CfnOutput(
+            self, "LambdaAliasArn",
+            value=self.quicklink_alias.function_arn,
+            description="Lambda alias ARN invoked by API Gateway"
+        )
+        
         CfnOutput(
             self, "AnalyticsQueueUrl",
             value=self.analytics_queue.queue_url,
@@ -1,8 +1,8 @@
 package inc.skt.quicklink;
 
 import com.amazonaws.serverless.exceptions.ContainerInitializationException;
-import com.amazonaws.serverless.proxy.model.AwsProxyRequest;
 import com.amazonaws.serverless.proxy.model.AwsProxyResponse;
+import com.amazonaws.serverless.proxy.model.HttpApiV2ProxyRequest;
 import com.amazonaws.serverless.proxy.spring.SpringBootLambdaContainerHandler;
 import com.amazonaws.services.lambda.runtime.Context;
 import com.amazonaws.services.lambda.runtime.RequestStreamHandler;
@@ -13,15 +13,15 @@ import java.io.OutputStream;
 
 /**
  * AWS Lambda handler for QuickLink URL Shortener.
- * Bridges API Gateway requests to Spring Boot application using AWS Serverless Java Container.
+ * Bridges API Gateway HTTP API (payload format 2.0) requests to Spring Boot application using AWS Serverless Java Container.
  */
 public class StreamLambdaHandler implements RequestStreamHandler {
     
-    private static SpringBootLambdaContainerHandler<AwsProxyRequest, AwsProxyResponse> handler;
+    private static SpringBootLambdaContainerHandler<HttpApiV2ProxyRequest, AwsProxyResponse> handler;
 
     static {
         try {
-            handler = SpringBootLambdaContainerHandler.getAwsProxyHandler(QuickLinkApplication.class);
+            handler = SpringBootLambdaContainerHandler.getHttpApiV2ProxyHandler(QuickLinkApplication.class);
         } catch (ContainerInitializationException e) {
             throw new RuntimeException("Could not initialize Spring Boot application", e);
         }
@@ -3,6 +3,7 @@ package inc.skt.quicklink.config;
 import org.springframework.beans.factory.annotation.Value;
 import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
+import software.amazon.awssdk.http.urlconnection.UrlConnectionHttpClient;
 import software.amazon.awssdk.regions.Region;
 import software.amazon.awssdk.services.sqs.SqsClient;
 
@@ -20,6 +21,7 @@ public class SqsConfig {
     public SqsClient sqsClient() {
         return SqsClient.builder()
             .region(Region.of(awsRegion))
+            .httpClientBuilder(UrlConnectionHttpClient.builder())
             .build();
     }
 }
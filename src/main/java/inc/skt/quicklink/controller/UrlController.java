@@ -42,10 +42,10 @@ public class UrlController {
     @PostMapping("/api/v1/shorten")
     @Operation(summary = "Create short URL", description = "Converts a long URL into a short URL")
     public ResponseEntity<ShortenResponse> shortenUrl(@RequestBody ShortenRequest request, HttpServletRequest httpRequest) {
-        // Hardcode stage name since API Gateway requires it
+        // HTTP API $default stage adds no path prefix, so short URLs live at the host root
         String scheme = httpRequest.getHeader("X-Forwarded-Proto") != null ? httpRequest.getHeader("X-Forwarded-Proto") : "https";
         String host = httpRequest.getHeader("Host");
-        String baseUrl = scheme + "://" + host + "/prod";
+        String baseUrl = scheme + "://" + host;
         ShortenResponse response = urlService.createShortUrl(request, baseUrl);
         return ResponseEntity.status(HttpStatus.CREATED).body(response);
     }
@@ -23,6 +23,7 @@ import org.springframework.test.web.servlet.MockMvc;
 
 import static org.mockito.ArgumentMatchers.any;
 import static org.mockito.ArgumentMatchers.anyString;
+import static org.mockito.ArgumentMatchers.eq;
 import static org.mockito.Mockito.doNothing;
 import static org.mockito.Mockito.doThrow;
 import static org.mockito.Mockito.when;
@@ -228,6 +229,30 @@ class UrlControllerTest {
             .andExpect(content().contentType(MediaType.APPLICATION_JSON));
     }
 
+    @Test
+    void should_buildShortUrlFromHostHeader_when_shortenRequested() throws Exception {
+        // Given
+        ShortenRequest request = new ShortenRequest("https://example.com/long-url", null);
+        String baseUrl = "https://abc123.execute-api.us-east-1.amazonaws.com";
+        ShortenResponse response = new ShortenResponse(
+            "0000001",
+            baseUrl + "/0000001",
+            "https://example.com/long-url",
+            1704067200L,
+            null
+        );
+        when(urlService.createShortUrl(any(ShortenRequest.class), eq(baseUrl))).thenReturn(response);
+
+        // When & Then
+        mockMvc.perform(post("/api/v1/shorten")
+                .header("Host", "abc123.execute-api.us-east-1.amazonaws.com")
+                .header("X-Forwarded-Proto", "https")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(objectMapper.writeValueAsString(request)))
+            .andExpect(status().isCreated())
+            .andExpect(jsonPath("$.shortUrl").value("https://abc123.execute-api.us-east-1.amazonaws.com/0000001"));
+    }
+
     // ========== Redirect Endpoint Tests ==========
 
     @Test